@@ -9,7 +9,7 @@ from .exceptions import (
     RedisSemaphoreNotAcquiredError,
     RedisSemaphoreTimeoutError,
 )
-from .semaphore import RedisSemaphore, SemaphoreInitStrategy
+from .semaphore import RedisSemaphore, SemaphoreInitStrategy, tune_redis_client
 
 __version__ = "1.0.0"
 __author__ = "Martin Mkhitaryan"
@@ -21,4 +21,5 @@ __all__ = [
     "RedisSemaphoreCountError",
     "RedisSemaphoreNotAcquiredError",
     "RedisSemaphoreTimeoutError",
+    "tune_redis_client",
 ]
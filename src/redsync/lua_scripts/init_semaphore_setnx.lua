@@ -0,0 +1,15 @@
+local list_key = KEYS[1]
+local init_key = KEYS[2]
+local n = tonumber(ARGV[1])
+local token = ARGV[2]
+
+if redis.call('SETNX', init_key, token) == 1 then
+    local tokens = {}
+    for i = 1, n do
+        tokens[i] = token
+    end
+    redis.call('RPUSH', list_key, unpack(tokens))
+    return 1
+end
+
+return 0
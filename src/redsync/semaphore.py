@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import NoScriptError, ResponseError
 
 from .exceptions import (
     RedisSemaphoreCountError,
@@ -12,16 +17,87 @@ from .exceptions import (
 )
 
 
-class SemaphoreInitStrategy(str, Enum):
+class SemaphoreInitStrategy(Enum):
     LUA = "lua"
     SETNX = "setnx"
 
 
 LUA_SCRIPTS_DIR = Path(__file__).resolve().parent / "lua_scripts"
 
+_INIT_LUA_SRC = (LUA_SCRIPTS_DIR / "init_semaphore.lua").read_bytes()
+_INIT_SETNX_LUA_SRC = (LUA_SCRIPTS_DIR / "init_semaphore_setnx.lua").read_bytes()
+
+_INIT_LUA_SHA = hashlib.sha1(_INIT_LUA_SRC).hexdigest()
+_INIT_SETNX_LUA_SHA = hashlib.sha1(_INIT_SETNX_LUA_SRC).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _sentinels(n: int) -> tuple[bytes, ...]:
+    return (RedisSemaphore.SENTINEL_VALUE,) * n
+
+
+async def _send_client_flags(conn) -> None:
+    for args in ((b"CLIENT", b"NO-EVICT", b"ON"), (b"CLIENT", b"NO-TOUCH", b"ON")):
+        try:
+            await conn.send_command(*args)
+            await conn.read_response()
+        except ResponseError:
+            # Requires Redis >= 7.0; older servers keep their defaults.
+            pass
+
+
+async def _tune_connection(conn) -> None:
+    # redis_connect_func replaces the default handshake, so run it first.
+    await conn.on_connect()
+    await _send_client_flags(conn)
+
+
+async def tune_redis_client(redis_client: Redis) -> None:
+    """Best-effort server-side tuning for clients dedicated to semaphores.
+
+    Enables ``CLIENT NO-EVICT`` and ``CLIENT NO-TOUCH`` so Redis skips
+    eviction and LRU/TTL bookkeeping for commands sent by this client.
+    Both flags are per connection, so they are installed as a connect hook
+    on the client's pool: every connection the pool creates from now on is
+    tuned, idle connections are tuned in place, and connections currently
+    checked out pick the flags up when they next reconnect. Requires
+    Redis >= 7.0; older servers are left at their defaults. For RESP3
+    parsing, construct the client with ``protocol=3`` (e.g.
+    ``Redis.from_url(url, protocol=3)``).
+    """
+    pool = redis_client.connection_pool
+    pool.connection_kwargs["redis_connect_func"] = _tune_connection
+    for conn in (*pool._available_connections, *pool._in_use_connections):
+        conn.redis_connect_func = _tune_connection
+    for conn in pool._available_connections:
+        if conn.is_connected:
+            await _send_client_flags(conn)
+
 
 class RedisSemaphore:
-    SENTINEL_VALUE = b"42"
+    __slots__ = (
+        "_redis",
+        "name",
+        "_count",
+        "_semaphore_init_strategy",
+        "_init_impl",
+        "_prefix",
+        "_list_key",
+        "_init_key",
+        "_permits",
+        "_release_frame",
+    )
+
+    # Permits are opaque placeholders; an empty bulk string is the smallest
+    # RESP payload ("$0\r\n\r\n") and shrinks both init traffic and the
+    # per-element list memory for large counts.
+    SENTINEL_VALUE = b""
+
+    _initialized: set[tuple[int, str, str]] = set()
+    _init_locks: dict[tuple[int, str, str], asyncio.Lock] = {}
+
+    _blmpop_supported: bool | None = None
+    _lpop_count_supported: bool | None = None
 
     def __init__(
         self,
@@ -39,12 +115,19 @@ class RedisSemaphore:
         self.name = name
         self._count = count
         self._semaphore_init_strategy = semaphore_init_strategy
+        self._init_impl = (
+            self._init_lua
+            if semaphore_init_strategy is SemaphoreInitStrategy.LUA
+            else self._init_setnx
+        )
         self._prefix = key_prefix.rstrip(":")
 
-        self._list_key = f"{self._prefix}:{name}:list"
-        self._init_key = f"{self._prefix}:{name}:init"
+        self._list_key = f"{self._prefix}:{name}:list".encode()
+        self._init_key = f"{self._prefix}:{name}:init".encode()
 
-        self._acquired = False
+        self._permits = 0
+        # Packed lazily on first release; pack_command lives on the connection.
+        self._release_frame: list[bytes] | None = None
 
     @classmethod
     async def create(
@@ -63,27 +146,196 @@ class RedisSemaphore:
             semaphore_init_strategy=semaphore_init_strategy,
             key_prefix=key_prefix,
         )
-        if instance._semaphore_init_strategy == SemaphoreInitStrategy.LUA:
-            await instance._init_lua()
-        else:
-            await instance._init_setnx()
+        cache_key = (id(redis_client), instance._prefix, name)
+        if cache_key in cls._initialized:
+            return instance
+
+        lock = cls._init_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            if cache_key in cls._initialized:
+                return instance
+
+            if not await redis_client.exists(instance._list_key):
+                await instance._init_impl()
+
+            cls._initialized.add(cache_key)
+            # Late waiters bail out on the _initialized check above, so the
+            # lock entry is no longer needed once init is done.
+            cls._init_locks.pop(cache_key, None)
 
         return instance
 
+    @classmethod
+    async def create_many(
+        cls,
+        redis_client: Redis,
+        names: list[str],
+        *,
+        count: int = 1,
+        semaphore_init_strategy: SemaphoreInitStrategy = SemaphoreInitStrategy.LUA,
+        key_prefix: str = "redis_semaphore",
+    ) -> list[RedisSemaphore]:
+        instances = [
+            cls(
+                redis_client,
+                name,
+                count=count,
+                semaphore_init_strategy=semaphore_init_strategy,
+                key_prefix=key_prefix,
+            )
+            for name in names
+        ]
+        pending = [
+            instance
+            for instance in instances
+            if (id(redis_client), instance._prefix, instance.name)
+            not in cls._initialized
+        ]
+        if not pending:
+            return instances
+
+        lua = semaphore_init_strategy is SemaphoreInitStrategy.LUA
+        sha = _INIT_LUA_SHA if lua else _INIT_SETNX_LUA_SHA
+        src = _INIT_LUA_SRC if lua else _INIT_SETNX_LUA_SRC
+
+        async def run_init_pipeline() -> None:
+            pipe = redis_client.pipeline(transaction=False)
+            for instance in pending:
+                keys = (
+                    [instance._list_key]
+                    if lua
+                    else [instance._list_key, instance._init_key]
+                )
+                pipe.evalsha(sha, len(keys), *keys, str(count), cls.SENTINEL_VALUE)
+            await pipe.execute()
+
+        try:
+            await run_init_pipeline()
+        except NoScriptError:
+            await redis_client.script_load(src)
+            await run_init_pipeline()
+
+        for instance in pending:
+            cls._initialized.add((id(redis_client), instance._prefix, instance.name))
+
+        return instances
+
     async def acquire(self, timeout: float | None = None) -> None:
-        timeout = 0 if timeout is None else max(0, timeout)
+        await self.acquire_many(1, timeout=timeout)
+
+    async def acquire_many(self, k: int, timeout: float | None = None) -> None:
+        if not (1 <= k <= 4096):
+            raise RedisSemaphoreCountError(k)
+
+        deadline = None
+        if timeout is not None and timeout > 0:
+            deadline = asyncio.get_running_loop().time() + timeout
+
+        acquired = 0
+        try:
+            while acquired < k:
+                remaining = 0.0
+                if deadline is not None:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    if remaining <= 0:
+                        raise RedisSemaphoreTimeoutError
+                acquired += await self._pop_permits(k - acquired, remaining)
+        except RedisSemaphoreTimeoutError:
+            if acquired:
+                try:
+                    await self._redis.rpush(self._list_key, *_sentinels(acquired))  # type: ignore
+                except BaseException:
+                    self._permits += acquired
+                    raise
+            raise
+        except BaseException:
+            # Credit permits popped before the failure (e.g. a connection
+            # error or cancellation mid-loop) so release_many() can return
+            # them instead of leaking them from the pool.
+            self._permits += acquired
+            raise
+
+        self._permits += acquired
+
+    async def _pop_permits(self, count: int, timeout: float) -> int:
+        cls = type(self)
+        # Opportunistic non-blocking pop: when permits are available this is
+        # a plain O(1) list op without BLPOP's server-side blocking machinery.
+        if count > 1 and cls._lpop_count_supported is not False:
+            try:
+                popped = await self._redis.lpop(self._list_key, count)  # type: ignore
+            except ResponseError as exc:
+                # LPOP's COUNT form requires Redis >= 6.2; degrade to the
+                # single-element pop below, like the BLMPOP branch does.
+                if "wrong number of arguments" not in str(exc).lower():
+                    raise
+                cls._lpop_count_supported = False
+            else:
+                cls._lpop_count_supported = True
+                if popped is not None:
+                    return len(popped)
+        if count == 1 or cls._lpop_count_supported is False:
+            if await self._redis.lpop(self._list_key) is not None:  # type: ignore
+                return 1
+
+        if count > 1 and cls._blmpop_supported is not False:
+            try:
+                result = await self._redis.execute_command(
+                    "BLMPOP", timeout, 1, self._list_key, "LEFT", "COUNT", count
+                )
+            except ResponseError as exc:
+                # BLMPOP requires Redis >= 7.0; fall back to BLPOP below.
+                # Any other error (e.g. WRONGTYPE) is the caller's problem.
+                if "unknown command" not in str(exc).lower():
+                    raise
+                cls._blmpop_supported = False
+            else:
+                cls._blmpop_supported = True
+                if result is None:
+                    raise RedisSemaphoreTimeoutError
+                return len(result[1])
+
         result = await self._redis.blpop(self._list_key, timeout=timeout)  # type: ignore
         if result is None:
             raise RedisSemaphoreTimeoutError
 
-        self._acquired = True
+        return 1
 
     async def release(self) -> None:
-        if not self._acquired:
+        if self._permits <= 0:
             raise RedisSemaphoreNotAcquiredError
 
-        await self._redis.rpush(self._list_key, self.SENTINEL_VALUE)  # type: ignore
-        self._acquired = False
+        # The RPUSH frame is identical on every release, so send the cached
+        # pre-packed bytes directly instead of re-packing the command.
+        pool = self._redis.connection_pool
+        try:
+            conn = await pool.get_connection()
+        except TypeError:
+            # redis-py < 5.3 requires the (since deprecated) command_name.
+            conn = await pool.get_connection("RPUSH")
+        try:
+            if self._release_frame is None:
+                self._release_frame = conn.pack_command(
+                    b"RPUSH", self._list_key, self.SENTINEL_VALUE
+                )
+            await conn.send_packed_command(self._release_frame)
+            await conn.read_response()
+        except RedisConnectionError:
+            await conn.disconnect()
+            raise
+        finally:
+            await pool.release(conn)
+
+        self._permits -= 1
+
+    async def release_many(self, n: int) -> None:
+        if not (1 <= n <= 4096):
+            raise RedisSemaphoreCountError(n)
+        if self._permits < n:
+            raise RedisSemaphoreNotAcquiredError
+
+        await self._redis.rpush(self._list_key, *_sentinels(n))  # type: ignore
+        self._permits -= n
 
     async def __aenter__(self) -> RedisSemaphore:
         await self.acquire()
@@ -95,17 +347,16 @@ class RedisSemaphore:
         await self.release()
 
     async def _init_lua(self) -> int:
-        script_obj = self._redis.register_script(
-            (LUA_SCRIPTS_DIR / "init_semaphore.lua").read_text()
+        return await self._eval_init(_INIT_LUA_SHA, _INIT_LUA_SRC, [self._list_key])
+
+    async def _init_setnx(self) -> int:
+        return await self._eval_init(
+            _INIT_SETNX_LUA_SHA, _INIT_SETNX_LUA_SRC, [self._list_key, self._init_key]
         )
-        return await script_obj(
-            keys=[self._list_key],
-            args=[str(self._count), self.SENTINEL_VALUE],
-        )  # type: ignore[return-value]
-
-    async def _init_setnx(self) -> None:
-        if await self._redis.setnx(self._init_key, self.SENTINEL_VALUE):
-            pipe = self._redis.pipeline()
-            pipe.rpush(self._list_key, *([self.SENTINEL_VALUE] * self._count))
-            pipe.delete(self._init_key)
-            await pipe.execute()
+
+    async def _eval_init(self, sha: str, src: bytes, keys: list[str]) -> int:
+        args = (str(self._count), self.SENTINEL_VALUE)
+        try:
+            return await self._redis.evalsha(sha, len(keys), *keys, *args)  # type: ignore
+        except NoScriptError:
+            return await self._redis.eval(src, len(keys), *keys, *args)  # type: ignore
@@ -1,8 +1,30 @@
+import os
+
 import pytest
+import pytest_asyncio
+from redis.asyncio import ConnectionPool, Redis
 
 from redsync import SemaphoreInitStrategy
 
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+
 
 @pytest.fixture(params=[SemaphoreInitStrategy.LUA, SemaphoreInitStrategy.SETNX])
 def semaphore_init_strategy(request):
     return request.param
+
+
+@pytest.fixture(scope="session")
+def redis_pool():
+    # One pool for the whole run so tests reuse sockets instead of paying a
+    # TCP handshake per client.
+    return ConnectionPool.from_url(REDIS_URL, max_connections=64)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis(redis_pool):
+    client = Redis(connection_pool=redis_pool)
+    try:
+        yield client
+    finally:
+        await client.aclose()
@@ -13,6 +13,7 @@ from redsync import (
     RedisSemaphoreNotAcquiredError,
     RedisSemaphoreTimeoutError,
     SemaphoreInitStrategy,
+    tune_redis_client,
 )
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
@@ -27,42 +28,40 @@ async def redis_client(url: str = REDIS_URL):
         await client.aclose()
 
 
-@pytest.mark.asyncio
-async def test_async_10_tasks_count_1(semaphore_init_strategy):
-    async with redis_client() as redis:
-        name = f"test_sem_{uuid.uuid4().hex}"
-        results = []
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_10_tasks_count_1(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    results = []
 
-        async def task(tid: int):
-            sem = await RedisSemaphore.create(
-                redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
-            )
-            async with sem:
-                results.append(tid)
-                await asyncio.sleep(0.01)
-                results.append(-tid)
+    async def task(tid: int):
+        sem = await RedisSemaphore.create(
+            redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
+        )
+        async with sem:
+            results.append(tid)
+            await asyncio.sleep(0.01)
+            results.append(-tid)
 
-        await asyncio.gather(*(task(i) for i in range(10)))
-        assert set(results) == set(range(-9, 10))
+    await asyncio.gather(*(task(i) for i in range(10)))
+    assert set(results) == set(range(-9, 10))
 
 
-@pytest.mark.asyncio
-async def test_async_tasks_count_3(semaphore_init_strategy):
-    async with redis_client() as redis:
-        name = f"test_sem_{uuid.uuid4().hex}"
-        results = []
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_tasks_count_3(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    results = []
 
-        async def task(tid: int):
-            sem = await RedisSemaphore.create(
-                redis, name, count=3, semaphore_init_strategy=semaphore_init_strategy
-            )
-            async with sem:
-                print(f"Task {tid} acquired semaphore {name}")
-                results.append(tid)
-                await asyncio.sleep(0.01)
+    async def task(tid: int):
+        sem = await RedisSemaphore.create(
+            redis, name, count=3, semaphore_init_strategy=semaphore_init_strategy
+        )
+        async with sem:
+            print(f"Task {tid} acquired semaphore {name}")
+            results.append(tid)
+            await asyncio.sleep(0.01)
 
-        await asyncio.gather(*(task(i) for i in range(9)))
-        assert set(results) == set(range(9))
+    await asyncio.gather(*(task(i) for i in range(9)))
+    assert set(results) == set(range(9))
 
 
 def test_multiprocess(semaphore_init_strategy):
@@ -70,7 +69,7 @@ def test_multiprocess(semaphore_init_strategy):
     processes = [
         multiprocessing.Process(
             target=_worker_process,
-            args=(name, str(semaphore_init_strategy)),
+            args=(name, semaphore_init_strategy),
         )
         for _ in range(10)
     ]
@@ -96,36 +95,116 @@ def _worker_process(name: str, strategy: SemaphoreInitStrategy) -> None:
     asyncio.run(run())
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_many(semaphore_init_strategy, redis):
+    names = [f"test_sem_{uuid.uuid4().hex}" for _ in range(5)]
+    sems = await RedisSemaphore.create_many(
+        redis, names, count=2, semaphore_init_strategy=semaphore_init_strategy
+    )
+    assert len(sems) == 5
+    for sem in sems:
+        await sem.acquire(timeout=1)
+        await sem.release()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_acquire_many(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=3, semaphore_init_strategy=semaphore_init_strategy
+    )
+    await sem.acquire_many(3)
+    with pytest.raises(RedisSemaphoreTimeoutError):
+        await sem.acquire(timeout=0.05)
+
+    await sem.release_many(3)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_acquire_many_timeout_returns_partial_permits(
+    semaphore_init_strategy, redis
+):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
+    )
+    with pytest.raises(RedisSemaphoreTimeoutError):
+        await sem.acquire_many(2, timeout=0.05)
+
+    # The single available permit must have been returned to the pool.
+    await sem.acquire(timeout=0.05)
+    await sem.release()
+
+
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.parametrize("count", [0, -1, 42000])
-async def test_count_error(count):
-    async with redis_client() as redis:
-        name = f"test_sem_{uuid.uuid4().hex}"
-        with pytest.raises(RedisSemaphoreCountError) as exc_info:
-            await RedisSemaphore.create(redis, name, count=count)
-        assert exc_info.value.count == count
-
-
-@pytest.mark.asyncio
-async def test_not_acquired_error(semaphore_init_strategy):
-    async with redis_client() as redis:
-        name = f"test_sem_{uuid.uuid4().hex}"
-        sem = await RedisSemaphore.create(
-            redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
-        )
-        with pytest.raises(RedisSemaphoreNotAcquiredError):
-            await sem.release()
+async def test_count_error(count, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    with pytest.raises(RedisSemaphoreCountError) as exc_info:
+        await RedisSemaphore.create(redis, name, count=count)
+    assert exc_info.value.count == count
 
 
-@pytest.mark.asyncio
-async def test_timeout_error(semaphore_init_strategy):
-    async with redis_client() as redis:
-        name = f"test_sem_{uuid.uuid4().hex}"
-        sem = await RedisSemaphore.create(
-            redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
-        )
-        await sem.acquire()
-        with pytest.raises(RedisSemaphoreTimeoutError):
-            await sem.acquire(timeout=0.05)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reentrant_acquire(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=2, semaphore_init_strategy=semaphore_init_strategy
+    )
+    await sem.acquire()
+    await sem.acquire()
+    await sem.release()
+    await sem.release()
+    with pytest.raises(RedisSemaphoreNotAcquiredError):
+        await sem.release()
+
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_release_many_not_acquired_error(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=3, semaphore_init_strategy=semaphore_init_strategy
+    )
+    await sem.acquire()
+    with pytest.raises(RedisSemaphoreNotAcquiredError):
+        await sem.release_many(2)
+
+    await sem.release()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_not_acquired_error(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
+    )
+    with pytest.raises(RedisSemaphoreNotAcquiredError):
         await sem.release()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tune_redis_client(semaphore_init_strategy, redis):
+    # Best-effort: must succeed on Redis >= 7.0 and be a no-op on older servers.
+    await tune_redis_client(redis)
+
+    # Connections created after tuning go through the connect hook and must
+    # still perform the normal handshake.
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
+    )
+    async with sem:
+        pass
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_timeout_error(semaphore_init_strategy, redis):
+    name = f"test_sem_{uuid.uuid4().hex}"
+    sem = await RedisSemaphore.create(
+        redis, name, count=1, semaphore_init_strategy=semaphore_init_strategy
+    )
+    await sem.acquire()
+    with pytest.raises(RedisSemaphoreTimeoutError):
+        await sem.acquire(timeout=0.05)
+
+    await sem.release()